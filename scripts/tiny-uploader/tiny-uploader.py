@@ -28,11 +28,12 @@
 #OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 import os
 import sys
-import requests
 from argparse import ArgumentParser
 
 
 def load(url, jwt, tdb_id, ttl_path):
+    # imported here so that --help and argument errors do not pay for it
+    import requests
     # set headers
     h = {"Authorization": f"Bearer {jwt}", "Content-Type": "text/turtle"}
     # upload data